@@ -1,5 +1,8 @@
+import snake_game
+
+
 def main():
-    print("Hello from simple-snake!")
+    snake_game.run()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@ Simple Snake Game using Pygame
 import pygame
 import sys
 import random
+from functools import lru_cache
+from collections import deque
+from itertools import repeat
 
 # Game Constants
 WINDOW_WIDTH = 800  # Fixed window width
@@ -15,14 +18,25 @@ DEFAULT_BOARD_ROWS = 20  # Default number of rows (vertical cells)
 MIN_BOARD_SIZE = 6  # Minimum board size
 MAX_BOARD_SIZE = 32  # Maximum board size
 
+# Cells are packed into a single int, (y << CELL_SHIFT) + x, so they hash and
+# compare as one small int. The row stride (64) is wider than the largest
+# board plus its border, so stepping off the left or right edge never wraps
+# around onto a cell of the neighbouring row
+CELL_SHIFT = 6
+CELL_STRIDE = 1 << CELL_SHIFT
+
 # These will be set dynamically based on user selection
 BOARD_COLS = DEFAULT_BOARD_COLS
 BOARD_ROWS = DEFAULT_BOARD_ROWS
+ALL_CELLS = frozenset()  # Every (packed) cell on the board
 
 # Offset to center the board in the window (will be calculated dynamically)
 OFFSET_X = 0
 OFFSET_Y = 0
 
+# Top-left pixel of each cell's interior, keyed by packed cell (set with the offset)
+CELL_PIXELS = {}
+
 # Colors (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -44,31 +58,137 @@ DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# Reverse of each direction, for blocking 180-degree turns
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Change of the packed cell for one step in each direction
+DIR_DELTA = {UP: -CELL_STRIDE, DOWN: CELL_STRIDE, LEFT: -1, RIGHT: 1}
+
+# Key bindings, looked up with one dict access per key press
+DIR_KEYS = {
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT,
+}
+CURSOR_KEYS = {pygame.K_UP: -1, pygame.K_DOWN: 1}  # Menu cursor movement
+BOARD_SIZE_KEYS = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}  # Board size change
+
+# Random source for food placement, with its bound method looked up once
+_RNG = random.Random()
+_choice = _RNG.choice
+
+# Fonts by size, created on first use (pygame.font.Font is expensive to build)
+_FONT_CACHE = {}
+
+
+def pack_cell(x, y):
+    """Pack grid coordinates into a single int cell"""
+    return (y << CELL_SHIFT) + x
+
+
+@lru_cache(maxsize=None)
+def _cell_surface(color):
+    """Return a filled surface the size of one cell's interior"""
+    surface = pygame.Surface((GRID_SIZE - 1, GRID_SIZE - 1)).convert()
+    surface.fill(color)
+    return surface
+
+
+class FreeCells:
+    """Board cells not covered by the snake, with O(1) updates and sampling"""
+
+    __slots__ = ("cells", "index")
+
+    def __init__(self, cells):
+        """Initialize with the given free cells"""
+        # Cells are kept in a list for random.choice, plus each cell's index
+        # in that list so one can be removed by swapping in the last cell
+        self.cells = []
+        self.index = {}
+        self.reset(cells)
+
+    def reset(self, cells):
+        """Replace the free cells, reusing the existing list and dict"""
+        self.cells[:] = cells
+        self.index.clear()
+        self.index.update((cell, i) for i, cell in enumerate(self.cells))
+
+    def __len__(self):
+        return len(self.cells)
+
+    def add(self, cell):
+        """Mark a cell as free"""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def discard(self, cell):
+        """Mark a cell as taken (no-op if it is not free)"""
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+
+    def choice(self):
+        """Return a random free cell"""
+        return _choice(self.cells)
+
 
 class Snake:
     """Snake class for the game"""
 
+    __slots__ = (
+        "board_cells",
+        "body",
+        "body_set",
+        "free_cells",
+        "direction",
+        "last_moved_direction",
+        "grow_pending",
+    )
+
     def __init__(self):
         """Initialize the snake at the center of the grid"""
-        self.body = [(BOARD_COLS // 2, BOARD_ROWS // 2)]
+        self.body = deque()
+        self.body_set = set()  # Same cells as body, for O(1) lookups
+        self.free_cells = FreeCells(())
+        self.reset()
+
+    def reset(self):
+        """Put the snake back at the center of the grid, reusing its containers"""
+        self.board_cells = ALL_CELLS  # Bound once; read on every move
+        start = pack_cell(BOARD_COLS // 2, BOARD_ROWS // 2)
+        self.body.clear()
+        self.body.append(start)
+        self.body_set.clear()
+        self.body_set.add(start)
+        self.free_cells.reset(self.board_cells.difference(self.body))
         self.direction = RIGHT
         self.last_moved_direction = RIGHT  # Track actual last move for input validation
         self.grow_pending = False
 
     def move(self):
         """Move the snake in the current direction"""
-        head_x, head_y = self.body[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
-
-        # Add new head
-        self.body.insert(0, new_head)
+        new_head = self.body[0] + DIR_DELTA[self.direction]
 
-        # Remove tail if not growing
+        # Remove tail if not growing (before adding the head, so moving into
+        # the cell the tail is leaving keeps that cell in body_set)
         if not self.grow_pending:
-            self.body.pop()
+            tail = self.body.pop()
+            self.body_set.discard(tail)
+            self.free_cells.add(tail)
         else:
             self.grow_pending = False
 
+        # Add new head
+        self.body.appendleft(new_head)
+        self.body_set.add(new_head)
+        self.free_cells.discard(new_head)
+
         # Update last moved direction for input validation
         self.last_moved_direction = self.direction
 
@@ -79,112 +199,114 @@ class Snake:
     def change_direction(self, new_direction):
         """Change the snake's direction (prevent 180-degree turn)"""
         # Can't turn back on itself - check against last actual move, not queued direction
-        opposite_of_last_move = (self.last_moved_direction[0] * -1, self.last_moved_direction[1] * -1)
-        if new_direction != opposite_of_last_move:
+        # (directions are always the module-level tuples, so identity is enough)
+        if new_direction is not OPPOSITE[self.last_moved_direction]:
             self.direction = new_direction
             return True
         return False
 
     def check_collision(self):
         """Check if snake collided with wall or itself"""
-        head_x, head_y = self.body[0]
-
         # Wall collision
-        if head_x < 0 or head_x >= BOARD_COLS or head_y < 0 or head_y >= BOARD_ROWS:
+        if self.body[0] not in self.board_cells:
             return True
 
-        # Self collision
-        if self.body[0] in self.body[1:]:
+        # Self collision - the head landed on a cell that was already in the
+        # set, so the body holds one more segment than there are unique cells
+        if len(self.body) != len(self.body_set):
             return True
 
         return False
 
     def can_move(self, direction):
         """Check if the snake can move in the given direction (for relaxed mode)"""
-        head_x, head_y = self.body[0]
-        new_head = (head_x + direction[0], head_y + direction[1])
+        new_head = self.body[0] + DIR_DELTA[direction]
 
         # Check wall collision
-        if (
-            new_head[0] < 0
-            or new_head[0] >= BOARD_COLS
-            or new_head[1] < 0
-            or new_head[1] >= BOARD_ROWS
-        ):
+        if new_head not in self.board_cells:
             return False
 
         # Check self collision
-        if new_head in self.body:
+        if new_head in self.body_set:
             return False
 
         return True
 
     def draw(self, screen):
         """Draw the snake on the screen"""
-        for segment in self.body:
-            rect = pygame.Rect(
-                OFFSET_X + segment[0] * GRID_SIZE + 1,
-                OFFSET_Y + segment[1] * GRID_SIZE + 1,
-                GRID_SIZE - 1,
-                GRID_SIZE - 1,
-            )
-            pygame.draw.rect(screen, GREEN, rect)
+        # Blit every segment in a single call instead of one draw per segment;
+        # map/zip resolve CELL_PIXELS once rather than once per segment
+        segment_surface = _cell_surface(GREEN)
+        positions = map(CELL_PIXELS.__getitem__, self.body)
+        screen.blits(zip(repeat(segment_surface), positions), doreturn=False)
 
 
 class Food:
     """Food class for the game"""
 
-    def __init__(self):
-        """Initialize food at a random position"""
-        self.position = (0, 0)
-        self.randomize_position()
+    __slots__ = ("position",)
+
+    def __init__(self, free_cells):
+        """Initialize food at a random free position"""
+        self.position = 0
+        self.randomize_position(free_cells)
 
-    def randomize_position(self):
-        """Place food at a random grid position"""
-        self.position = (
-            random.randint(0, BOARD_COLS - 1),
-            random.randint(0, BOARD_ROWS - 1),
-        )
+    def randomize_position(self, free_cells):
+        """Place food at a random free grid position"""
+        # Pick directly from the free cells instead of retrying random cells,
+        # which could take many tries on a nearly full board
+        self.position = free_cells.choice()
 
     def draw(self, screen):
         """Draw the food on the screen"""
-        rect = pygame.Rect(
-            OFFSET_X + self.position[0] * GRID_SIZE + 1,
-            OFFSET_Y + self.position[1] * GRID_SIZE + 1,
-            GRID_SIZE - 1,
-            GRID_SIZE - 1,
-        )
-        pygame.draw.rect(screen, RED, rect)
+        screen.blit(_cell_surface(RED), CELL_PIXELS[self.position])
 
 
 def draw_grid(screen):
     """Draw grid lines for better visibility"""
     board_pixel_width = BOARD_COLS * GRID_SIZE
     board_pixel_height = BOARD_ROWS * GRID_SIZE
+    left, top = OFFSET_X, OFFSET_Y
+    right, bottom = OFFSET_X + board_pixel_width, OFFSET_Y + board_pixel_height
+
+    # Zig-zag through the vertical lines as one polyline; the connecting
+    # segments run along the top/bottom border, which is a grid line anyway
+    vertical_points = []
+    for i, x in enumerate(range(left, right + 1, GRID_SIZE)):
+        ends = [(x, top), (x, bottom)]
+        vertical_points.extend(ends if i % 2 == 0 else reversed(ends))
 
-    for x in range(0, board_pixel_width + 1, GRID_SIZE):
-        pygame.draw.line(
-            screen,
-            GRAY,
-            (OFFSET_X + x, OFFSET_Y),
-            (OFFSET_X + x, OFFSET_Y + board_pixel_height),
-        )
-    for y in range(0, board_pixel_height + 1, GRID_SIZE):
-        pygame.draw.line(
-            screen,
-            GRAY,
-            (OFFSET_X, OFFSET_Y + y),
-            (OFFSET_X + board_pixel_width, OFFSET_Y + y),
-        )
+    # Same for the horizontal lines, connecting along the left/right border
+    horizontal_points = []
+    for i, y in enumerate(range(top, bottom + 1, GRID_SIZE)):
+        ends = [(left, y), (right, y)]
+        horizontal_points.extend(ends if i % 2 == 0 else reversed(ends))
+
+    pygame.draw.lines(screen, GRAY, False, vertical_points)
+    pygame.draw.lines(screen, GRAY, False, horizontal_points)
+
+
+def create_grid_surface():
+    """Render the background and grid once so each frame can just blit it"""
+    grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    grid_surface.fill(BLACK)
+    draw_grid(grid_surface)
+    return grid_surface
+
+
+@lru_cache(maxsize=128)
+def _render_text(text, size, color):
+    """Render text once per (text, size, color); later calls reuse the surface"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font.render(text, True, color).convert_alpha()
 
 
 def draw_text(screen, text, size, x, y, color=WHITE):
-    """Draw text on the screen"""
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
-    text_rect.center = (x, y)
-    screen.blit(text_surface, text_rect)
+    """Draw text on the screen and return the area it covers"""
+    text_surface = _render_text(text, size, color)
+    return screen.blit(text_surface, text_surface.get_rect(center=(x, y)))
 
 
 def draw_mode_selection(screen, selected_mode, cursor_position, board_cols, board_rows):
@@ -245,15 +367,88 @@ def draw_mode_selection(screen, selected_mode, cursor_position, board_cols, boar
     pygame.display.flip()
 
 
+def draw_end_menu(screen, menu_position, title, subtitle=None):
+    """Draw the game over / game complete message with its restart menu"""
+    center_x = WINDOW_WIDTH // 2
+    center_y = WINDOW_HEIGHT // 2
+
+    draw_text(screen, title, 72, center_x, center_y - 80)
+    options_y = center_y + 20
+    if subtitle:
+        draw_text(screen, subtitle, 48, center_x, center_y - 20)
+        options_y += 20
+
+    # Menu options
+    restart_color = WHITE if menu_position == 0 else GRAY
+    menu_color = WHITE if menu_position == 1 else GRAY
+    cursor_restart = "> " if menu_position == 0 else "  "
+    cursor_menu = "> " if menu_position == 1 else "  "
+
+    draw_text(screen, cursor_restart + "Restart", 36, center_x, options_y, restart_color)
+    draw_text(screen, cursor_menu + "Main Menu", 36, center_x, options_y + 40, menu_color)
+    draw_text(
+        screen, "Press R to restart, ENTER to confirm", 24, center_x, options_y + 90, GRAY
+    )
+
+
+def new_game():
+    """Create the snake and food for a fresh round"""
+    snake = Snake()
+    # Make sure food doesn't spawn on snake's initial position
+    food = Food(snake.free_cells)
+    return snake, food
+
+
+def cell_rect(cell):
+    """Return the on-screen rect of a cell's interior (inside the grid lines)"""
+    return pygame.Rect(CELL_PIXELS[cell], (GRID_SIZE - 1, GRID_SIZE - 1))
+
+
+def advance_snake(snake, food, changed_cells):
+    """Move the snake one cell, eating the food if it is in the way
+
+    Every cell whose contents may have changed is added to changed_cells.
+    Returns True once the snake has filled the whole board.
+    """
+    # Check if next position has food (grow before moving)
+    ate_food = snake.body[0] + DIR_DELTA[snake.direction] == food.position
+    if ate_food:
+        snake.grow()
+
+    changed_cells.add(snake.body[-1])  # Tail cell, freed unless growing
+    snake.move()
+    changed_cells.add(snake.body[0])
+
+    # If food was eaten, check if board is full or spawn new food
+    if not ate_food:
+        return False
+    if not snake.free_cells:
+        return True
+    # Make sure food doesn't spawn on snake
+    food.randomize_position(snake.free_cells)
+    changed_cells.add(food.position)
+    return False
+
+
 def main():
     """Main game function"""
-    global BOARD_COLS, BOARD_ROWS, OFFSET_X, OFFSET_Y
+    global BOARD_COLS, BOARD_ROWS, ALL_CELLS, OFFSET_X, OFFSET_Y, CELL_PIXELS
 
     # Initialize Pygame
     pygame.init()
 
-    # Create initial window for settings
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    # Only QUIT, KEYDOWN and VIDEOEXPOSE (to repaint) are ever handled; drop
+    # everything else (mouse motion in particular) before it reaches the
+    # Python event queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE])
+
+    # Create initial window for settings. Coming back from a game, reuse the
+    # existing window: the cached cell, grid and text surfaces were converted
+    # to its pixel format, and every surface is created after this point
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Simple Snake Game - Settings")
 
     # Create clock for controlling frame rate
@@ -265,49 +460,50 @@ def main():
     board_cols = DEFAULT_BOARD_COLS
     board_rows = DEFAULT_BOARD_ROWS
     selecting_mode = True
+    menu_dirty = True  # The menu only needs drawing when its state changed
 
     while selecting_mode:
-        draw_mode_selection(
-            screen, selected_mode, cursor_position, board_cols, board_rows
-        )
+        if menu_dirty:
+            draw_mode_selection(
+                screen, selected_mode, cursor_position, board_cols, board_rows
+            )
+            menu_dirty = False
 
-        for event in pygame.event.get():
+        # The menu only changes on input, so if nothing is queued, sleep
+        # until the next event arrives instead of polling at 60 FPS
+        for event in pygame.event.get() or [pygame.event.wait()]:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if event.type == pygame.VIDEOEXPOSE:
+                menu_dirty = True
+
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    cursor_position = (cursor_position - 1) % 4
-                    # Update selected mode based on cursor
-                    if cursor_position == 0:
-                        selected_mode = CLASSIC
-                    elif cursor_position == 1:
-                        selected_mode = RELAXED
+                cursor_step = CURSOR_KEYS.get(event.key)
+                size_step = BOARD_SIZE_KEYS.get(event.key)
 
-                elif event.key == pygame.K_DOWN:
-                    cursor_position = (cursor_position + 1) % 4
+                if cursor_step:
+                    menu_dirty = True
+                    cursor_position = (cursor_position + cursor_step) % 4
                     # Update selected mode based on cursor
                     if cursor_position == 0:
                         selected_mode = CLASSIC
                     elif cursor_position == 1:
                         selected_mode = RELAXED
 
-                elif event.key == pygame.K_LEFT:
+                elif size_step:
+                    menu_dirty = True
                     shift_pressed = pygame.key.get_mods() & pygame.KMOD_SHIFT
-                    step = 10 if shift_pressed else 1
+                    step = size_step * (10 if shift_pressed else 1)
                     if cursor_position == 2:  # Board columns
-                        board_cols = max(MIN_BOARD_SIZE, board_cols - step)
+                        board_cols = min(
+                            MAX_BOARD_SIZE, max(MIN_BOARD_SIZE, board_cols + step)
+                        )
                     elif cursor_position == 3:  # Board rows
-                        board_rows = max(MIN_BOARD_SIZE, board_rows - step)
-
-                elif event.key == pygame.K_RIGHT:
-                    shift_pressed = pygame.key.get_mods() & pygame.KMOD_SHIFT
-                    step = 10 if shift_pressed else 1
-                    if cursor_position == 2:  # Board columns
-                        board_cols = min(MAX_BOARD_SIZE, board_cols + step)
-                    elif cursor_position == 3:  # Board rows
-                        board_rows = min(MAX_BOARD_SIZE, board_rows + step)
+                        board_rows = min(
+                            MAX_BOARD_SIZE, max(MIN_BOARD_SIZE, board_rows + step)
+                        )
 
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                     # Only start game if on mode selection (position 0 or 1)
@@ -319,6 +515,9 @@ def main():
     # Update global grid settings
     BOARD_COLS = board_cols
     BOARD_ROWS = board_rows
+    ALL_CELLS = frozenset(
+        pack_cell(x, y) for x in range(BOARD_COLS) for y in range(BOARD_ROWS)
+    )
 
     # Calculate offset to center the board
     board_pixel_width = BOARD_COLS * GRID_SIZE
@@ -326,379 +525,209 @@ def main():
     OFFSET_X = (WINDOW_WIDTH - board_pixel_width) // 2
     OFFSET_Y = (WINDOW_HEIGHT - board_pixel_height) // 2
 
+    # Precompute every cell's pixel position, including the ring just outside
+    # the board where the head ends up after hitting a wall
+    CELL_PIXELS = {
+        pack_cell(x, y): (OFFSET_X + x * GRID_SIZE + 1, OFFSET_Y + y * GRID_SIZE + 1)
+        for x in range(-1, BOARD_COLS + 1)
+        for y in range(-1, BOARD_ROWS + 1)
+    }
+
+    # The grid never changes during a game, so render it only once
+    grid_surface = create_grid_surface()
+
     # Window is already correct size (800x800)
     pygame.display.set_caption("Simple Snake Game")
 
     mode = selected_mode
 
+    # Loop invariants, worked out once instead of on every frame
+    is_classic = mode == CLASSIC
+    mode_text = f"Mode: {mode.upper()}"
+    score_x = WINDOW_WIDTH // 2
+    mode_y = WINDOW_HEIGHT - 20
+    segment_surface = _cell_surface(GREEN)
+    food_surface = _cell_surface(RED)
+
     # Create game objects
-    snake = Snake()
-    food = Food()
-    # Make sure food doesn't spawn on snake's initial position
-    while food.position in snake.body:
-        food.randomize_position()
-    score = 1
+    snake, food = new_game()
 
     # Game state
     game_over = False
-    game_over_menu_position = 0  # 0=restart, 1=main menu
     game_complete = False
-    complete_menu_position = 0  # 0=restart, 1=main menu
+    end_menu_position = 0  # 0=restart, 1=main menu
     running = True
 
-    # Game loop
-    if mode == CLASSIC:
-        # Classic mode: automatic movement with timed intervals
-        last_move_time = pygame.time.get_ticks()
-        while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                # Handle keyboard input (Classic mode - direction change only)
-                if event.type == pygame.KEYDOWN and not game_over and not game_complete:
-                    if event.key == pygame.K_UP:
-                        snake.change_direction(UP)
-                    elif event.key == pygame.K_DOWN:
-                        snake.change_direction(DOWN)
-                    elif event.key == pygame.K_LEFT:
-                        snake.change_direction(LEFT)
-                    elif event.key == pygame.K_RIGHT:
-                        snake.change_direction(RIGHT)
-                    elif event.key == pygame.K_q:
-                        # Q key triggers game over
-                        game_over = True
-                        game_over_menu_position = 0
-
-                # Handle game over menu
-                if event.type == pygame.KEYDOWN and game_over:
-                    if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
-                        game_over_menu_position = 1 - game_over_menu_position
-                    elif event.key == pygame.K_RETURN:
-                        if game_over_menu_position == 0:  # Restart
-                            snake = Snake()
-                            food = Food()
-                            while food.position in snake.body:
-                                food.randomize_position()
-                            score = 1
-                            game_over = False
-                            game_over_menu_position = 0
-                            last_move_time = pygame.time.get_ticks()
-                        else:  # Main menu
-                            return
-                    elif event.key == pygame.K_r:
-                        # R key restarts regardless of cursor position
-                        snake = Snake()
-                        food = Food()
-                        while food.position in snake.body:
-                            food.randomize_position()
-                        score = 1
-                        game_over = False
-                        game_over_menu_position = 0
-                        last_move_time = pygame.time.get_ticks()
-
-                # Handle game complete menu
-                if event.type == pygame.KEYDOWN and game_complete:
-                    if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
-                        complete_menu_position = 1 - complete_menu_position
-                    elif event.key == pygame.K_RETURN:
-                        if complete_menu_position == 0:  # Restart
-                            snake = Snake()
-                            food = Food()
-                            while food.position in snake.body:
-                                food.randomize_position()
-                            score = 1
-                            game_complete = False
-                            complete_menu_position = 0
-                            last_move_time = pygame.time.get_ticks()
-                        else:  # Main menu
-                            return  # Return to main menu (restart main function)
-                    elif event.key == pygame.K_r:
-                        # R key restarts regardless of cursor position
-                        snake = Snake()
-                        food = Food()
-                        while food.position in snake.body:
-                            food.randomize_position()
-                        score = 1
-                        game_complete = False
-                        complete_menu_position = 0
-                        last_move_time = pygame.time.get_ticks()
-
-            if not game_over:
-                # Move snake automatically at timed intervals (Classic mode)
-                current_time = pygame.time.get_ticks()
-                if current_time - last_move_time >= SNAKE_MOVE_INTERVAL:
-                    # Check if next position has food (grow before moving)
-                    next_head = (snake.body[0][0] + snake.direction[0],
-                                snake.body[0][1] + snake.direction[1])
-                    if next_head == food.position:
-                        snake.grow()
-
-                    snake.move()
-                    last_move_time = current_time
-
-                    # If food was eaten, check if board is full or spawn new food
-                    if snake.body[0] == food.position:
-                        score += 1
-                        # Check if board is completely filled
-                        if len(snake.body) >= BOARD_COLS * BOARD_ROWS:
-                            game_complete = True
-                            complete_menu_position = 0
-                        else:
-                            food.randomize_position()
-                            # Make sure food doesn't spawn on snake
-                            while food.position in snake.body:
-                                food.randomize_position()
-
-                    # Check collisions
-                    if snake.check_collision():
-                        game_over = True
-                        game_over_menu_position = 0
-
-            # Clear screen
-            screen.fill(BLACK)
-
-            # Draw grid
-            draw_grid(screen)
-
-            # Draw game objects
-            snake.draw(screen)
-            if not game_complete:
-                food.draw(screen)
-
-            # Draw score and mode
-            draw_text(screen, f"Score: {score}", 36, WINDOW_WIDTH // 2, 30)
-            draw_text(screen, f"Mode: {mode.upper()}", 28, 80, WINDOW_HEIGHT - 20, GRAY)
-
-            # Draw game over message
-            if game_over:
-                draw_text(
-                    screen, "GAME OVER!", 72, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80
-                )
-
-                # Menu options
-                restart_color = WHITE if game_over_menu_position == 0 else GRAY
-                menu_color = WHITE if game_over_menu_position == 1 else GRAY
-                cursor_restart = "> " if game_over_menu_position == 0 else "  "
-                cursor_menu = "> " if game_over_menu_position == 1 else "  "
-
-                draw_text(
-                    screen, cursor_restart + "Restart", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20, restart_color
-                )
-                draw_text(
-                    screen, cursor_menu + "Main Menu", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60, menu_color
-                )
-                draw_text(
-                    screen, "Press R to restart, ENTER to confirm", 24, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 110, GRAY
-                )
-
-            # Draw game complete message
-            if game_complete:
-                draw_text(
-                    screen, "CONGRATULATIONS!", 72, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80
+    # Frames are only drawn when something changed. While playing, only the
+    # cells the snake or food touched are redrawn; anything else (first
+    # frame, restart, overlays and their menu cursor) sets full_redraw
+    full_redraw = True
+    changed_cells = set()
+    drawn_score = None
+    score_rect = None
+
+    # Classic mode moves the snake at timed intervals, relaxed mode moves it
+    # once per arrow key press; everything else is shared between the modes
+    last_move_time = pygame.time.get_ticks()
+    while running:
+        events = pygame.event.get()
+        if not events and not full_redraw:
+            # Nothing to draw until the next event (or, during classic play,
+            # the next move), so sleep until then instead of running empty
+            # frames
+            event = None
+            if is_classic and not game_over and not game_complete:
+                time_to_move = (
+                    last_move_time + SNAKE_MOVE_INTERVAL - pygame.time.get_ticks()
                 )
-                draw_text(
-                    screen, "Board Complete!", 48, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20
-                )
-
-                # Menu options
-                restart_color = WHITE if complete_menu_position == 0 else GRAY
-                menu_color = WHITE if complete_menu_position == 1 else GRAY
-                cursor_restart = "> " if complete_menu_position == 0 else "  "
-                cursor_menu = "> " if complete_menu_position == 1 else "  "
-
-                draw_text(
-                    screen, cursor_restart + "Restart", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40, restart_color
-                )
-                draw_text(
-                    screen, cursor_menu + "Main Menu", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80, menu_color
-                )
-                draw_text(
-                    screen, "Press R to restart, ENTER to confirm", 24, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 130, GRAY
-                )
-
-            # Update display
-            pygame.display.flip()
-
-            # Control frame rate
-            clock.tick(FPS)
-
-    elif mode == RELAXED:
-        # Relaxed mode: move only on key press
-        while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                # Handle keyboard input (Relaxed mode - move on key press)
-                if event.type == pygame.KEYDOWN and not game_over and not game_complete:
-                    new_direction = None
-                    if event.key == pygame.K_UP:
-                        new_direction = UP
-                    elif event.key == pygame.K_DOWN:
-                        new_direction = DOWN
-                    elif event.key == pygame.K_LEFT:
-                        new_direction = LEFT
-                    elif event.key == pygame.K_RIGHT:
-                        new_direction = RIGHT
-                    elif event.key == pygame.K_q:
+                if time_to_move > 0:
+                    event = pygame.event.wait(time_to_move)
+            else:
+                # Relaxed mode and the end-of-game menus only change on input
+                event = pygame.event.wait()
+            if event is not None and event.type != pygame.NOEVENT:
+                events.append(event)
+
+        # Handle events
+        desired_direction = None  # Classic mode: last valid arrow key this frame
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents were lost, e.g. after being uncovered
+                full_redraw = True
+
+            elif event.type == pygame.KEYDOWN and (game_over or game_complete):
+                # Handle game over / game complete menu
+                if event.key in CURSOR_KEYS:
+                    end_menu_position = 1 - end_menu_position
+                    full_redraw = True
+                elif event.key == pygame.K_RETURN and end_menu_position == 1:
+                    return  # Return to main menu (restart main function)
+                elif event.key == pygame.K_RETURN or event.key == pygame.K_r:
+                    # R key restarts regardless of cursor position
+                    snake.reset()
+                    food.randomize_position(snake.free_cells)
+                    desired_direction = None
+                    game_over = False
+                    game_complete = False
+                    end_menu_position = 0
+                    last_move_time = pygame.time.get_ticks()
+                    full_redraw = True
+
+            elif event.type == pygame.KEYDOWN:
+                new_direction = DIR_KEYS.get(event.key)
+                if new_direction is None:
+                    if event.key == pygame.K_q:
                         # Q key triggers game over
                         game_over = True
-                        game_over_menu_position = 0
-
-                    # Move snake only if direction is valid and movement is possible
-                    if new_direction and not game_over:
-                        # Check if direction change is valid (not 180 degrees)
-                        if snake.change_direction(new_direction):
-                            # Check if snake can move in this direction (not into wall or itself)
-                            if snake.can_move(new_direction):
-                                # Check if next position has food (grow before moving)
-                                next_head = (snake.body[0][0] + new_direction[0],
-                                            snake.body[0][1] + new_direction[1])
-                                if next_head == food.position:
-                                    snake.grow()
-
-                                snake.move()
-
-                                # If food was eaten, check if board is full or spawn new food
-                                if snake.body[0] == food.position:
-                                    score += 1
-                                    # Check if board is completely filled
-                                    if len(snake.body) >= BOARD_COLS * BOARD_ROWS:
-                                        game_complete = True
-                                        complete_menu_position = 0
-                                    else:
-                                        food.randomize_position()
-                                        # Make sure food doesn't spawn on snake
-                                        while food.position in snake.body:
-                                            food.randomize_position()
-                            # If can't move, just ignore the input (don't move, don't game over)
-
-                # Handle game over menu
-                if event.type == pygame.KEYDOWN and game_over:
-                    if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
-                        game_over_menu_position = 1 - game_over_menu_position
-                    elif event.key == pygame.K_RETURN:
-                        if game_over_menu_position == 0:  # Restart
-                            snake = Snake()
-                            food = Food()
-                            while food.position in snake.body:
-                                food.randomize_position()
-                            score = 1
-                            game_over = False
-                            game_over_menu_position = 0
-                        else:  # Main menu
-                            return
-                    elif event.key == pygame.K_r:
-                        # R key restarts regardless of cursor position
-                        snake = Snake()
-                        food = Food()
-                        while food.position in snake.body:
-                            food.randomize_position()
-                        score = 1
-                        game_over = False
-                        game_over_menu_position = 0
-
-                # Handle game complete menu
-                if event.type == pygame.KEYDOWN and game_complete:
-                    if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
-                        complete_menu_position = 1 - complete_menu_position
-                    elif event.key == pygame.K_RETURN:
-                        if complete_menu_position == 0:  # Restart
-                            snake = Snake()
-                            food = Food()
-                            while food.position in snake.body:
-                                food.randomize_position()
-                            score = 1
-                            game_complete = False
-                            complete_menu_position = 0
-                        else:  # Main menu
-                            return  # Return to main menu (restart main function)
-                    elif event.key == pygame.K_r:
-                        # R key restarts regardless of cursor position
-                        snake = Snake()
-                        food = Food()
-                        while food.position in snake.body:
-                            food.randomize_position()
-                        score = 1
-                        game_complete = False
-                        complete_menu_position = 0
-
-            # Clear screen
-            screen.fill(BLACK)
-
-            # Draw grid
-            draw_grid(screen)
+                        end_menu_position = 0
+                        full_redraw = True
+                elif is_classic:
+                    # Classic mode - direction change only. Of the keys pressed
+                    # before the next move, the last one that isn't a 180-degree
+                    # turn wins, so just remember it and apply it once below
+                    if new_direction is not OPPOSITE[snake.last_moved_direction]:
+                        desired_direction = new_direction
+                else:
+                    # Relaxed mode - move only if the direction is valid (not
+                    # 180 degrees) and the snake won't hit a wall or itself;
+                    # otherwise just ignore the input
+                    if snake.change_direction(new_direction) and snake.can_move(
+                        new_direction
+                    ):
+                        if advance_snake(snake, food, changed_cells):
+                            game_complete = True
+                            end_menu_position = 0
+                            full_redraw = True
+
+        if desired_direction is not None:
+            snake.change_direction(desired_direction)
+
+        if is_classic and not game_over and not game_complete:
+            # Move snake automatically at timed intervals
+            current_time = pygame.time.get_ticks()
+            if current_time - last_move_time >= SNAKE_MOVE_INTERVAL:
+                last_move_time = current_time
+                if advance_snake(snake, food, changed_cells):
+                    game_complete = True
+                    end_menu_position = 0
+                    full_redraw = True
+
+                # Check collisions
+                if snake.check_collision():
+                    game_over = True
+                    end_menu_position = 0
+                    full_redraw = True
+
+        if full_redraw:
+            # Clear screen and draw grid
+            screen.blit(grid_surface, (0, 0))
 
             # Draw game objects
             snake.draw(screen)
             if not game_complete:
                 food.draw(screen)
 
-            # Draw score and mode
-            draw_text(screen, f"Score: {score}", 36, WINDOW_WIDTH // 2, 30)
-            draw_text(screen, f"Mode: {mode.upper()}", 28, 80, WINDOW_HEIGHT - 20, GRAY)
+            # Draw score and mode (the score starts at 1 and goes up by one per
+            # food eaten, which is exactly the snake's length)
+            drawn_score = len(snake.body)
+            score_rect = draw_text(screen, f"Score: {drawn_score}", 36, score_x, 30)
+            draw_text(screen, mode_text, 28, 80, mode_y, GRAY)
 
-            # Draw game over message
+            # Draw game over / game complete message
             if game_over:
-                draw_text(
-                    screen, "GAME OVER!", 72, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80
-                )
-
-                # Menu options
-                restart_color = WHITE if game_over_menu_position == 0 else GRAY
-                menu_color = WHITE if game_over_menu_position == 1 else GRAY
-                cursor_restart = "> " if game_over_menu_position == 0 else "  "
-                cursor_menu = "> " if game_over_menu_position == 1 else "  "
-
-                draw_text(
-                    screen, cursor_restart + "Restart", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20, restart_color
-                )
-                draw_text(
-                    screen, cursor_menu + "Main Menu", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60, menu_color
-                )
-                draw_text(
-                    screen, "Press R to restart, ENTER to confirm", 24, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 110, GRAY
-                )
-
-            # Draw game complete message
-            if game_complete:
-                draw_text(
-                    screen, "CONGRATULATIONS!", 72, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80
-                )
-                draw_text(
-                    screen, "Board Complete!", 48, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20
-                )
-
-                # Menu options
-                restart_color = WHITE if complete_menu_position == 0 else GRAY
-                menu_color = WHITE if complete_menu_position == 1 else GRAY
-                cursor_restart = "> " if complete_menu_position == 0 else "  "
-                cursor_menu = "> " if complete_menu_position == 1 else "  "
-
-                draw_text(
-                    screen, cursor_restart + "Restart", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40, restart_color
-                )
-                draw_text(
-                    screen, cursor_menu + "Main Menu", 36, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80, menu_color
-                )
-                draw_text(
-                    screen, "Press R to restart, ENTER to confirm", 24, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 130, GRAY
+                draw_end_menu(screen, end_menu_position, "GAME OVER!")
+            elif game_complete:
+                draw_end_menu(
+                    screen, end_menu_position, "CONGRATULATIONS!", "Board Complete!"
                 )
 
             # Update display
             pygame.display.flip()
-
-            # Control frame rate (higher for responsiveness)
-            clock.tick(60)
+            full_redraw = False
+
+        elif changed_cells:
+            # Repaint just the changed cells from the grid surface, then draw
+            # whatever now occupies them
+            dirty_rects = []
+            for cell in changed_cells:
+                rect = cell_rect(cell)
+                screen.blit(grid_surface, rect, rect)
+                if cell in snake.body_set:
+                    screen.blit(segment_surface, rect)
+                elif cell == food.position:
+                    screen.blit(food_surface, rect)
+                dirty_rects.append(rect)
+
+            # The score only changes when food is eaten; erase the old text
+            # first since the new one may be narrower
+            if len(snake.body) != drawn_score:
+                drawn_score = len(snake.body)
+                screen.blit(grid_surface, score_rect, score_rect)
+                dirty_rects.append(score_rect)
+                score_rect = draw_text(screen, f"Score: {drawn_score}", 36, score_x, 30)
+                dirty_rects.append(score_rect)
+
+            # Update only the changed areas of the display
+            pygame.display.update(dirty_rects)
+
+        changed_cells.clear()
+
+        # Control frame rate
+        clock.tick(FPS)
 
     # Quit game
     pygame.quit()
     sys.exit()
 
 
-if __name__ == "__main__":
+def run():
+    """Run the game, returning to the settings screen after each game"""
     while True:
         main()
+
+
+if __name__ == "__main__":
+    run()